@@ -1,19 +1,42 @@
+import collections
+import os
+import shutil
+import struct
 import sys
+import tempfile
 import serial
+import selectors
 import threading
 import time
 import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import serial.tools.list_ports
-from queue import Queue
+
+# Tek read çağrısında çekilecek azami byte sayısı
+_READ_CHUNK = 65536
+
+# Yazdırılabilir-ASCII çeviri tablosu: 32-126 aralığı dışındaki byte'lar '.' olur
+_ASCII_TBL = bytes(b if 32 <= b <= 126 else 46 for b in range(256))
+
+# Widget başına tutulacak azami satır sayısı ve aşılınca baştan silinecek blok
+_MAX_WIDGET_LINES = 5000
+_TRIM_LINES = 1000
+
+# Ring buffer kayıt başlığı: (timestamp, yön kodu, uzunluk) sabit boyutlu ve
+# C hızında pack/unpack edilir; tuple tahsisi gerektirmez
+_HDR = struct.Struct('=dBI')
+_DIR_TO_DEVICE = 0
+_DIR_FROM_DEVICE = 1
 
 class SerialWorker:
     """Serial işlemleri için worker class"""
     def __init__(self, data_callback, status_callback):
         self.virtual_serial = None
         self.physical_serial = None
-        self.running = False
+        self.sel = None
+        self._stop = threading.Event()
+        self._stop.set()
         self.data_callback = data_callback
         self.status_callback = status_callback
         
@@ -28,7 +51,8 @@ class SerialWorker:
                 stopbits=serial.STOPBITS_ONE,
                 bytesize=serial.EIGHTBITS
             )
-            
+            self._enlarge_buffers(self.virtual_serial)
+
             self.physical_serial = serial.Serial(
                 port=physical_port,
                 baudrate=baudrate,
@@ -37,68 +61,121 @@ class SerialWorker:
                 stopbits=serial.STOPBITS_ONE,
                 bytesize=serial.EIGHTBITS
             )
-            
+            self._enlarge_buffers(self.physical_serial)
+
             self.status_callback(True, "Bağlantı başarılı!")
             return True
-            
+
         except Exception as e:
             self.status_callback(False, f"Bağlantı hatası: {str(e)}")
             return False
+
+    @staticmethod
+    def _enlarge_buffers(ser):
+        """Sürücü RX/TX buffer'larını 1 MB'a çıkar (sadece Windows'ta var)
+
+        Varsayılan 4 KB buffer yüksek baud'da burst'leri küçük read'lere
+        böler; POSIX'te metot yoktur, sessizce geçilir.
+        """
+        try:
+            ser.set_buffer_size(rx_size=1 << 20, tx_size=1 << 20)
+        except Exception:
+            pass
     
     def start_monitoring(self):
         """Monitoring başlat"""
-        self.running = True
-        
-        # İki thread başlat
-        self.t1 = threading.Thread(target=self.virtual_to_physical, daemon=True)
-        self.t2 = threading.Thread(target=self.physical_to_virtual, daemon=True)
-        
-        self.t1.start()
-        self.t2.start()
-    
+        self._stop.clear()
+
+        if sys.platform == 'win32':
+            # Windows'ta selector seri port handle'larıyla çalışmaz (sadece soketler);
+            # bloklayan read ile yön başına bir thread kullan
+            self.t1 = threading.Thread(
+                target=self._pump_win32,
+                args=(self.virtual_serial, self.physical_serial, "TO_DEVICE"),
+                daemon=True
+            )
+            self.t2 = threading.Thread(
+                target=self._pump_win32,
+                args=(self.physical_serial, self.virtual_serial, "FROM_DEVICE"),
+                daemon=True
+            )
+
+            self.t1.start()
+            self.t2.start()
+        else:
+            # Linux/macOS: epoll/kqueue tabanlı selector ile her iki yön tek thread'de;
+            # kernel veri geldiğinde uyandırır, sleep/polling gerekmez
+            self.sel = selectors.DefaultSelector()
+            self.sel.register(
+                self.virtual_serial.fileno(), selectors.EVENT_READ,
+                data=("TO_DEVICE", self.virtual_serial, self.physical_serial)
+            )
+            self.sel.register(
+                self.physical_serial.fileno(), selectors.EVENT_READ,
+                data=("FROM_DEVICE", self.physical_serial, self.virtual_serial)
+            )
+
+            self.t1 = threading.Thread(target=self._pump, daemon=True)
+            self.t1.start()
+
     def stop_monitoring(self):
         """Monitoring durdur"""
-        self.running = False
-        
-        if self.virtual_serial and self.virtual_serial.is_open:
-            self.virtual_serial.close()
-        if self.physical_serial and self.physical_serial.is_open:
-            self.physical_serial.close()
-    
-    def virtual_to_physical(self):
-        """Sanal -> Fiziksel port thread"""
-        while self.running:
+        # Önce event'i işaretle, sonra portları kapat: kapanış read'i
+        # SerialException ile uyandırır ve thread anında çıkar
+        self._stop.set()
+
+        if self.sel:
+            self.sel.close()
+            self.sel = None
+        # Kapatmadan önce OS buffer'larını bir kez boşalt (tcdrain);
+        # aktarım sırasında paket başına flush yapılmaz
+        for ser in (self.virtual_serial, self.physical_serial):
+            if ser and ser.is_open:
+                try:
+                    ser.flush()
+                except Exception:
+                    pass
+                ser.close()
+
+    def _pump(self):
+        """Her iki yönü tek thread'de taşıyan selector döngüsü"""
+        # Sıcak döngü: attribute lookup'ları yerel değişkene alarak
+        # paket başına bytecode maliyetini düşür
+        select = self.sel.select
+        read = os.read
+        callback = self.data_callback
+        stop_set = self._stop.is_set
+        while not stop_set():
             try:
-                if self.virtual_serial and self.virtual_serial.is_open:
-                    if self.virtual_serial.in_waiting > 0:
-                        data = self.virtual_serial.read(self.virtual_serial.in_waiting)
-                        if data:
-                            self.data_callback(data, "TO_DEVICE")
-                            if self.physical_serial and self.physical_serial.is_open:
-                                self.physical_serial.write(data)
-                                self.physical_serial.flush()
-                time.sleep(0.001)
+                for key, _ in select(0.5):
+                    direction, src, dst = key.data
+                    data = read(src.fileno(), _READ_CHUNK)
+                    if data:
+                        callback(data, direction)
+                        if dst.is_open:
+                            dst.write(data)
             except Exception as e:
-                if self.running:
-                    self.status_callback(False, f"V->P Hata: {str(e)}")
+                if not self._stop.is_set():
+                    self.status_callback(False, f"Aktarım hatası: {str(e)}")
                 break
-    
-    def physical_to_virtual(self):
-        """Fiziksel -> Sanal port thread"""
-        while self.running:
+
+    def _pump_win32(self, src, dst, direction):
+        """Tek yönü bloklayan read ile taşıyan thread (Windows)"""
+        while not self._stop.is_set():
             try:
-                if self.physical_serial and self.physical_serial.is_open:
-                    if self.physical_serial.in_waiting > 0:
-                        data = self.physical_serial.read(self.physical_serial.in_waiting)
-                        if data:
-                            self.data_callback(data, "FROM_DEVICE")
-                            if self.virtual_serial and self.virtual_serial.is_open:
-                                self.virtual_serial.write(data)
-                                self.virtual_serial.flush()
-                time.sleep(0.001)
+                # Bloklayan read: ilk byte gelene (veya timeout'a) kadar bekle,
+                # sonra buffer'da birikmiş olanı tek seferde al
+                data = src.read(1)
+                waiting = src.in_waiting
+                if waiting > 0:
+                    data += src.read(min(waiting, _READ_CHUNK))
+                if data:
+                    self.data_callback(data, direction)
+                    if dst and dst.is_open:
+                        dst.write(data)
             except Exception as e:
-                if self.running:
-                    self.status_callback(False, f"P->V Hata: {str(e)}")
+                if not self._stop.is_set():
+                    self.status_callback(False, f"Aktarım hatası ({direction}): {str(e)}")
                 break
 
 class SerialSnifferGUI:
@@ -113,8 +190,27 @@ class SerialSnifferGUI:
             'start_time': None
         }
         
-        # Thread-safe queue for GUI updates
-        self.gui_queue = Queue()
+        # Worker -> GUI ring buffer: tek üretici / tek tüketici olduğundan
+        # deque'nin GIL-korumalı append/popleft'i kilitsiz ve O(1) çalışır;
+        # maxlen aşırı yük altında bloklamak yerine en eski kaydı düşürür
+        self.gui_queue = collections.deque(maxlen=100000)
+        self.status_queue = collections.deque(maxlen=100)
+
+        # Saniyesi aynı olan paketler için strftime sonucunu tekrar kullan
+        self._ts_cache = (0, '')
+
+        # Durum mesajları tick'te tek seferde uygulanır (her çağrıda relayout olmasın)
+        self._pending_status = None
+        self._last_status = None
+
+        # Arşiv Tk widget'ları değil, arka planda yazılan append-only dosya;
+        # widget'lar sadece son satırları gösterir
+        self._log_queue = collections.deque(maxlen=100000)
+        self._log_event = threading.Event()
+        self._log_path = tempfile.NamedTemporaryFile(
+            prefix='sniffer_log_', suffix='.txt', delete=False).name
+        self._log_thread = threading.Thread(target=self._log_writer, daemon=True)
+        self._log_thread.start()
         
         self.init_ui()
         self.setup_timer()
@@ -196,16 +292,56 @@ class SerialSnifferGUI:
         self.save_btn = ttk.Button(row2, text="💾 Kaydet", command=self.save_log)
         self.save_btn.pack(side=tk.LEFT, padx=(0, 10))
         
-        # İstatistikler
-        self.stats_label = ttk.Label(row2, text="📊 İstatistikler: Hazır", foreground="blue")
-        self.stats_label.pack(side=tk.RIGHT, padx=(10, 0))
+        # İstatistikler: her alan kendi StringVar'ına bağlı ayrı label;
+        # değer değişmeyince set edilmez, Tk de yeniden çizmez
+        stats_frame = ttk.Frame(row2)
+        stats_frame.pack(side=tk.RIGHT, padx=(10, 0))
+
+        self.stats_vars = {
+            'elapsed': tk.StringVar(value="📊 İstatistikler: Hazır"),
+            'to': tk.StringVar(),
+            'from': tk.StringVar(),
+            'total': tk.StringVar()
+        }
+        self._stats_shown = {}
+        for key in ('elapsed', 'to', 'from', 'total'):
+            ttk.Label(stats_frame, textvariable=self.stats_vars[key],
+                      foreground="blue").pack(side=tk.LEFT, padx=(0, 8))
     
+    def _create_log_text(self, parent, **text_opts):
+        """Append-only görünümler için Text + Scrollbar çifti oluştur
+
+        ScrolledText yerine undo'suz düz Text: her insert'te undo stack
+        büyümez ve scrollbar geometrisi yeniden hesaplanmaz.
+        """
+        text = tk.Text(
+            parent,
+            font=("Consolas", 9),
+            insertbackground="white",
+            wrap=tk.NONE,
+            state=tk.DISABLED,
+            undo=False,
+            maxundo=0,
+            **text_opts
+        )
+        scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(fill=tk.BOTH, expand=True)
+        return text
+
     def create_data_area(self, parent):
         """Veri görüntüleme alanı oluştur"""
         # Ana notebook (tab container)
         notebook = ttk.Notebook(parent)
         notebook.pack(fill=tk.BOTH, expand=True)
-        
+        self.notebook = notebook
+
+        # Aktif sekme indeksi önbellekte tutulur; sadece görünen sekme
+        # için formatlama yapılır (tam geçmiş her zaman log dosyasında)
+        self._active_tab = 0
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
         # Tab 1: Ayrı Paneller
         split_frame = ttk.Frame(notebook)
         notebook.add(split_frame, text="📱 Ayrı Paneller")
@@ -216,30 +352,12 @@ class SerialSnifferGUI:
         
         # Sol panel - Giden veriler
         left_frame = ttk.LabelFrame(paned, text="📤 Cihaza Giden Veriler (Uygulama → Cihaz)", padding="5")
-        self.to_device_text = scrolledtext.ScrolledText(
-            left_frame, 
-            font=("Consolas", 9), 
-            bg="#2b2b2b", 
-            fg="#ff6b6b",
-            insertbackground="white",
-            wrap=tk.NONE,
-            state=tk.DISABLED
-        )
-        self.to_device_text.pack(fill=tk.BOTH, expand=True)
+        self.to_device_text = self._create_log_text(left_frame, bg="#2b2b2b", fg="#ff6b6b")
         paned.add(left_frame, weight=1)
         
         # Sağ panel - Gelen veriler
         right_frame = ttk.LabelFrame(paned, text="📥 Cihazdan Gelen Veriler (Cihaz → Uygulama)", padding="5")
-        self.from_device_text = scrolledtext.ScrolledText(
-            right_frame, 
-            font=("Consolas", 9), 
-            bg="#2b2b2b", 
-            fg="#4ecdc4",
-            insertbackground="white",
-            wrap=tk.NONE,
-            state=tk.DISABLED
-        )
-        self.from_device_text.pack(fill=tk.BOTH, expand=True)
+        self.from_device_text = self._create_log_text(right_frame, bg="#2b2b2b", fg="#4ecdc4")
         paned.add(right_frame, weight=1)
         
         # Tab 2: Birleşik Görünüm
@@ -249,17 +367,12 @@ class SerialSnifferGUI:
         combined_label_frame = ttk.LabelFrame(combined_frame, text="🔄 Tüm Veri Akışı (Zaman Sıralı)", padding="5")
         combined_label_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        self.all_data_text = scrolledtext.ScrolledText(
-            combined_label_frame,
-            font=("Consolas", 9),
-            bg="#2b2b2b",
-            fg="#ffffff",
-            insertbackground="white",
-            wrap=tk.NONE,
-            state=tk.DISABLED
-        )
-        self.all_data_text.pack(fill=tk.BOTH, expand=True)
-        
+        self.all_data_text = self._create_log_text(combined_label_frame, bg="#2b2b2b", fg="#ffffff")
+
+        # Yön renk etiketleri bir kez burada tanımlanır
+        self.all_data_text.tag_config("to_device", foreground="#ff6b6b")
+        self.all_data_text.tag_config("from_device", foreground="#4ecdc4")
+
         # Tab 3: Raw Hex View
         hex_frame = ttk.Frame(notebook)
         notebook.add(hex_frame, text="🔍 Raw Hex")
@@ -267,17 +380,23 @@ class SerialSnifferGUI:
         hex_label_frame = ttk.LabelFrame(hex_frame, text="⚡ Raw Hex Dump", padding="5")
         hex_label_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        self.hex_text = scrolledtext.ScrolledText(
-            hex_label_frame,
-            font=("Consolas", 9),
-            bg="#1a1a1a",
-            fg="#00ff00",
-            insertbackground="white",
-            wrap=tk.NONE,
-            state=tk.DISABLED
-        )
-        self.hex_text.pack(fill=tk.BOTH, expand=True)
-    
+        self.hex_text = self._create_log_text(hex_label_frame, bg="#1a1a1a", fg="#00ff00")
+
+        # Widget başına gösterilen satır sayısı (sınırlama için)
+        self._line_counts = {
+            self.to_device_text: 0,
+            self.from_device_text: 0,
+            self.all_data_text: 0,
+            self.hex_text: 0
+        }
+
+    def _on_tab_changed(self, event=None):
+        """Aktif sekme indeksini önbelleğe al"""
+        try:
+            self._active_tab = self.notebook.index('current')
+        except tk.TclError:
+            pass
+
     def create_status_bar(self):
         """Durum çubuğu oluştur"""
         self.status_frame = ttk.Frame(self.root)
@@ -329,6 +448,8 @@ class SerialSnifferGUI:
     def get_available_ports(self):
         """Tüm mevcut COM portlarını listele"""
         ports = []
+        # Cihaz adı -> combobox etiketi; varlık kontrolü O(1) olsun diye
+        self._ports_by_dev = {}
         try:
             available_ports = serial.tools.list_ports.comports()
             for port in available_ports:
@@ -338,9 +459,10 @@ class SerialSnifferGUI:
                 if port.manufacturer and port.manufacturer != "n/a":
                     port_info += f" ({port.manufacturer})"
                 ports.append(port_info)
+                self._ports_by_dev[port.device] = port_info
         except Exception as e:
             print(f"Port tarama hatası: {e}")
-        
+
         return ports
     
     def refresh_ports(self):
@@ -352,20 +474,20 @@ class SerialSnifferGUI:
             self.virtual_port_combo['values'] = ports
             self.physical_port_combo['values'] = ports
             
-            # Mevcut seçimleri koru
-            current_virtual = self.virtual_port_var.get()
-            current_physical = self.physical_port_var.get()
-            
+            # Mevcut seçimleri koru (cihaz adı ile O(1) sözlük kontrolü)
+            current_virtual = self.virtual_port_var.get().split(' - ')[0]
+            current_physical = self.physical_port_var.get().split(' - ')[0]
+
             # Eğer seçili portlar hala mevcutsa koru
-            if current_virtual and any(current_virtual.split(' -')[0] in port for port in ports):
+            if current_virtual and current_virtual in self._ports_by_dev:
                 pass  # Mevcut seçimi koru
             elif ports:
                 # COM4'ü varsayılan olarak seç (sanal port için)
-                com4_port = next((port for port in ports if "COM4" in port), None)
+                com4_port = self._ports_by_dev.get("COM4")
                 if com4_port:
                     self.virtual_port_var.set(com4_port)
-            
-            if current_physical and any(current_physical.split(' -')[0] in port for port in ports):
+
+            if current_physical and current_physical in self._ports_by_dev:
                 pass  # Mevcut seçimi koru
             elif ports:
                 # İlk portu fiziksel port olarak seç
@@ -412,73 +534,140 @@ class SerialSnifferGUI:
     
     def handle_data(self, data, direction):
         """Gelen veriyi işle"""
-        # Thread-safe GUI güncellemesi için queue kullan
-        self.gui_queue.put(('data', data, direction))
-    
+        # Paketi başlık + payload olarak tek bytes kaydına paketle;
+        # aynı kayıt hem GUI hem log ring buffer'ına girer
+        dir_code = _DIR_TO_DEVICE if direction == "TO_DEVICE" else _DIR_FROM_DEVICE
+        record = _HDR.pack(time.time(), dir_code, len(data)) + data
+        self.gui_queue.append(record)
+        self._log_queue.append(record)
+        self._log_event.set()
+
     def handle_connection_status(self, success, message):
         """Bağlantı durumu işle"""
-        self.gui_queue.put(('status', success, message))
+        self.status_queue.append((success, message))
+
+    def _log_writer(self):
+        """Paketleri arka planda append-only log dosyasına yazan thread"""
+        ts_cache = (0, '')
+        with open(self._log_path, 'ab', buffering=1 << 16) as f:
+            f.write(b"=== USB/Serial Sniffer Log ===\n")
+            f.write(f"Tarih: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n".encode('utf-8'))
+            f.flush()
+            while True:
+                self._log_event.wait(0.5)
+                self._log_event.clear()
+                wrote = False
+                while self._log_queue:
+                    record = self._log_queue.popleft()
+                    ts, dir_code, _length = _HDR.unpack_from(record)
+                    data = record[_HDR.size:]
+                    sec = int(ts)
+                    if sec != ts_cache[0]:
+                        ts_cache = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+                    arrow = ">>>" if dir_code == _DIR_TO_DEVICE else "<<<"
+                    hex_str = data.hex(' ').upper()
+                    ascii_str = data.translate(_ASCII_TBL).decode('ascii')
+                    line = f"[{ts_cache[1]}.{int((ts - sec) * 1000):03d}] {arrow} {hex_str} | {ascii_str}\n"
+                    f.write(line.encode('utf-8'))
+                    wrote = True
+                if wrote:
+                    f.flush()
     
     def process_gui_queue(self):
         """GUI queue'sunu işle"""
         try:
-            while not self.gui_queue.empty():
-                item = self.gui_queue.get_nowait()
-                
-                if item[0] == 'data':
-                    self.display_data(item[1], item[2])
-                elif item[0] == 'status':
-                    self.display_connection_status(item[1], item[2])
-                    
+            # Bekleyen tüm paketleri widget başına parça listesinde topla;
+            # Tk insert maliyeti paket başına değil tick başına ödenir
+            bufs = {
+                'to_device': [],
+                'from_device': [],
+                'all_to': [],
+                'all_from': [],
+                'hex': [],
+            }
+            has_data = False
+
+            while self.status_queue:
+                success, message = self.status_queue.popleft()
+                self.display_connection_status(success, message)
+
+            while self.gui_queue:
+                self.display_data(self.gui_queue.popleft(), bufs)
+                has_data = True
+
+            if has_data:
+                self.flush_display_buffers(bufs)
+
         except Exception as e:
             print(f"GUI queue işleme hatası: {e}")
-    
-    def display_data(self, data, direction):
-        """Veriyi GUI'de göster"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        hex_str = ' '.join(f'{b:02X}' for b in data)
-        ascii_str = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in data)
-        
-        if direction == "TO_DEVICE":
+
+    def display_data(self, record, bufs):
+        """Kaydın başlığını çözüp veriyi tick buffer'larına formatla"""
+        ts, dir_code, length = _HDR.unpack_from(record)
+        data = record[_HDR.size:]
+        sec = int(ts)
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+        timestamp = f"{self._ts_cache[1]}.{int((ts - sec) * 1000):03d}"
+        hex_str = data.hex(' ').upper()
+
+        if dir_code == _DIR_TO_DEVICE:
             arrow = ">>>"
-            self.stats['bytes_to_device'] += len(data)
+            self.stats['bytes_to_device'] += length
             self.stats['packets_to_device'] += 1
-            target_text = self.to_device_text
         else:
             arrow = "<<<"
-            self.stats['bytes_from_device'] += len(data)
+            self.stats['bytes_from_device'] += length
             self.stats['packets_from_device'] += 1
-            target_text = self.from_device_text
-        
-        # Formatlanmış metin
-        log_entry = f"[{timestamp}] {arrow} ({len(data)} bytes)\nHEX: {hex_str}\nASC: {ascii_str}\n{'-'*60}\n"
-        
-        # Ayrı panellere ekle
-        target_text.config(state=tk.NORMAL)
-        target_text.insert(tk.END, log_entry)
-        target_text.see(tk.END)
-        target_text.config(state=tk.DISABLED)
-        
-        # Birleşik görünüme ekle
-        combined_entry = f"[{timestamp}] {arrow} {hex_str} | {ascii_str}\n"
-        self.all_data_text.config(state=tk.NORMAL)
-        if direction == "TO_DEVICE":
-            self.all_data_text.insert(tk.END, combined_entry, "to_device")
+
+        # Sadece görünen sekme için formatla; tam geçmiş zaten arka plan
+        # thread'i tarafından log dosyasına yazılıyor
+        active = self._active_tab
+        if active == 0:
+            # Ayrı paneller
+            ascii_str = data.translate(_ASCII_TBL).decode('ascii')
+            log_entry = f"[{timestamp}] {arrow} ({length} bytes)\nHEX: {hex_str}\nASC: {ascii_str}\n{'-'*60}\n"
+            if dir_code == _DIR_TO_DEVICE:
+                bufs['to_device'].append(log_entry)
+            else:
+                bufs['from_device'].append(log_entry)
+        elif active == 1:
+            # Birleşik görünüm (yön etiketine göre ayrı buffer)
+            ascii_str = data.translate(_ASCII_TBL).decode('ascii')
+            combined_entry = f"[{timestamp}] {arrow} {hex_str} | {ascii_str}\n"
+            if dir_code == _DIR_TO_DEVICE:
+                bufs['all_to'].append(combined_entry)
+            else:
+                bufs['all_from'].append(combined_entry)
         else:
-            self.all_data_text.insert(tk.END, combined_entry, "from_device")
-        self.all_data_text.see(tk.END)
-        self.all_data_text.config(state=tk.DISABLED)
-        
-        # Raw hex görünümüne ekle
-        hex_entry = f"[{timestamp}] {arrow} {hex_str}\n"
-        self.hex_text.config(state=tk.NORMAL)
-        self.hex_text.insert(tk.END, hex_entry)
-        self.hex_text.see(tk.END)
-        self.hex_text.config(state=tk.DISABLED)
-        
-        # Renk etiketlerini ayarla
-        self.all_data_text.tag_config("to_device", foreground="#ff6b6b")
-        self.all_data_text.tag_config("from_device", foreground="#4ecdc4")
+            # Raw hex
+            bufs['hex'].append(f"[{timestamp}] {arrow} {hex_str}\n")
+
+    def flush_display_buffers(self, bufs):
+        """Tick boyunca biriken parçaları widget'lara tek insert ile yaz"""
+        def append(widget, parts, tag=None):
+            if not parts:
+                return
+            # str.join C hızında tek geçiş; parça parça += gibi O(N^2) değil
+            text = ''.join(parts)
+            widget.config(state=tk.NORMAL)
+            if tag:
+                widget.insert(tk.END, text, tag)
+            else:
+                widget.insert(tk.END, text)
+            # Widget'ı sınırlı tut; tam geçmiş zaten log dosyasında
+            self._line_counts[widget] += text.count('\n')
+            while self._line_counts[widget] > _MAX_WIDGET_LINES:
+                widget.delete('1.0', f'{_TRIM_LINES + 1}.0')
+                self._line_counts[widget] -= _TRIM_LINES
+            widget.see(tk.END)
+            widget.config(state=tk.DISABLED)
+
+        append(self.to_device_text, bufs['to_device'])
+        append(self.from_device_text, bufs['from_device'])
+        append(self.all_data_text, bufs['all_to'], "to_device")
+        append(self.all_data_text, bufs['all_from'], "from_device")
+        append(self.hex_text, bufs['hex'])
     
     def display_connection_status(self, success, message):
         """Bağlantı durumunu göster"""
@@ -491,23 +680,37 @@ class SerialSnifferGUI:
     
     def update_status(self, message):
         """Durum çubuğunu güncelle"""
-        self.status_label.config(text=message)
+        # Sadece mesajı kaydet; widget timer tick'inde bir kez yazılır
+        self._pending_status = message
+
+    def flush_status(self):
+        """Bekleyen durum mesajını değiştiyse status bar'a uygula"""
+        if self._pending_status is not None and self._pending_status != self._last_status:
+            self.status_label.config(text=self._pending_status)
+            self._last_status = self._pending_status
     
+    def _set_stat(self, key, value):
+        """StringVar'ı sadece değer değiştiyse set et"""
+        if self._stats_shown.get(key) != value:
+            self.stats_vars[key].set(value)
+            self._stats_shown[key] = value
+
     def update_stats(self):
-        """İstatistikleri güncelle"""
+        """İstatistikleri güncelle (sadece değişen alanlar yazılır)"""
         if self.stats['start_time']:
             elapsed = time.time() - self.stats['start_time']
             total_bytes = self.stats['bytes_to_device'] + self.stats['bytes_from_device']
             total_packets = self.stats['packets_to_device'] + self.stats['packets_from_device']
-            
-            stats_text = (f"📊 Süre: {elapsed:.0f}s | "
-                         f"📤: {self.stats['bytes_to_device']}B/{self.stats['packets_to_device']}P | "
-                         f"📥: {self.stats['bytes_from_device']}B/{self.stats['packets_from_device']}P | "
-                         f"Toplam: {total_bytes}B/{total_packets}P")
-            
-            self.stats_label.config(text=stats_text)
+
+            self._set_stat('elapsed', f"📊 Süre: {elapsed:.0f}s |")
+            self._set_stat('to', f"📤: {self.stats['bytes_to_device']}B/{self.stats['packets_to_device']}P |")
+            self._set_stat('from', f"📥: {self.stats['bytes_from_device']}B/{self.stats['packets_from_device']}P |")
+            self._set_stat('total', f"Toplam: {total_bytes}B/{total_packets}P")
         else:
-            self.stats_label.config(text="📊 İstatistikler: Hazır")
+            self._set_stat('elapsed', "📊 İstatistikler: Hazır")
+            self._set_stat('to', "")
+            self._set_stat('from', "")
+            self._set_stat('total', "")
     
     def clear_data(self):
         """Tüm veriyi temizle"""
@@ -515,6 +718,7 @@ class SerialSnifferGUI:
             text_widget.config(state=tk.NORMAL)
             text_widget.delete(1.0, tk.END)
             text_widget.config(state=tk.DISABLED)
+            self._line_counts[text_widget] = 0
         
         # İstatistikleri sıfırla (sadece sayıları, zamanı koru)
         if not self.stats['start_time']:  # Eğer çalışmıyorsa tamamen sıfırla
@@ -544,28 +748,12 @@ class SerialSnifferGUI:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write("=== USB/Serial Sniffer Log ===\n")
-                    f.write(f"Tarih: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    
-                    f.write("GIDEN VERİLER (Uygulama → Cihaz):\n")
-                    f.write("=" * 50 + "\n")
-                    f.write(self.to_device_text.get(1.0, tk.END))
-                    
-                    f.write("\n\nGELEN VERİLER (Cihaz → Uygulama):\n")
-                    f.write("=" * 50 + "\n")
-                    f.write(self.from_device_text.get(1.0, tk.END))
-                    
-                    f.write("\n\nTÜM VERİ AKIŞI:\n")
-                    f.write("=" * 50 + "\n")
-                    f.write(self.all_data_text.get(1.0, tk.END))
-                    
-                    f.write("\n\nRAW HEX DUMP:\n")
-                    f.write("=" * 50 + "\n")
-                    f.write(self.hex_text.get(1.0, tk.END))
-                
+                # Tam geçmiş arka plan thread'inin yazdığı dosyada;
+                # widget içeriğini okumaya gerek yok
+                self._log_event.set()
+                shutil.copy(self._log_path, filename)
                 messagebox.showinfo("Başarılı", f"Log dosyası kaydedildi:\n{filename}")
-                
+
             except Exception as e:
                 messagebox.showerror("Hata", f"Dosya kaydedilemedi:\n{str(e)}")
     
@@ -743,6 +931,7 @@ Yasal sorumluluk kullanıcıya aittir."""
         """GUI güncelleme zamanlayıcısını ayarla"""
         def timer_callback():
             self.process_gui_queue()
+            self.flush_status()
             self.update_stats()
             self.root.after(100, timer_callback)  # 100ms'de bir güncelle
         